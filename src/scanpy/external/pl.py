@@ -2,17 +2,22 @@
 
 from __future__ import annotations
 
-import contextlib
+from functools import partial
 from typing import TYPE_CHECKING
 
-import matplotlib.pyplot as plt
 import numpy as np
+import pandas as pd
 from anndata import AnnData  # noqa: TCH002
+from matplotlib import colormaps
 from matplotlib.axes import Axes  # noqa: TCH002
+from matplotlib.cm import ScalarMappable
+from matplotlib.colors import BoundaryNorm, ListedColormap, Normalize, to_rgba
+from matplotlib.ticker import NullLocator
 from sklearn.utils import deprecated
 
 from .._compat import old_positionals
-from .._utils import _doc_params
+from .._settings import settings
+from .._utils import _doc_params, sanitize_anndata
 from .._utils._doctests import doctest_needs
 from ..plotting import _scrublet, _utils, embedding
 from ..plotting._docs import (
@@ -21,12 +26,14 @@ from ..plotting._docs import (
     doc_scatter_embedding,
     doc_show_save_ax,
 )
-from ..plotting._tools.scatterplots import _wraps_plot_scatter
+from ..plotting._tools.scatterplots import _get_palette, _wraps_plot_scatter
 from .tl._wishbone import _anndata_to_wishbone
 
 if TYPE_CHECKING:
     from collections.abc import Collection
-    from typing import Any
+    from typing import Any, Literal
+
+    from matplotlib.image import AxesImage
 
 
 __all__ = [
@@ -139,22 +146,47 @@ def harmony_timeseries(
     If `show==False` a :class:`~matplotlib.axes.Axes` or a list of it.
 
     """
-    tp_name = adata.uns["harmony_timepoint_var"]
-    tps = adata.obs[tp_name].unique()
+    import matplotlib.pyplot as plt
 
-    fig, axes = plt.subplots(1, len(tps))
+    # like `embedding`, turn string annotations into categoricals
+    sanitize_anndata(adata)
+    tp_name = adata.uns["harmony_timepoint_var"]
+    time_points = adata.obs[tp_name]
+    if not isinstance(time_points.dtype, pd.CategoricalDtype):
+        msg = f"Time point column {tp_name!r} needs to be categorical."
+        raise ValueError(msg)
+    # integer codes make each panel's mask a cheap comparison
+    codes = time_points.cat.codes.to_numpy()
+    tps = time_points.cat.categories
+    palette = _get_palette(adata, tp_name)
+    # Fetch coordinates and labels once and scatter them directly,
+    # instead of dispatching a full `embedding` call per time point.
+    coords = adata.obsm["X_harmony"]
+    size = 120000 / adata.n_obs
+
+    fig, axes = plt.subplots(
+        1,
+        len(tps),
+        sharex=True,
+        sharey=True,
+        squeeze=False,
+        subplot_kw=dict(frame_on=False),
+    )
+    axes = axes.ravel()
+    # all panels share one x and one y ticker, so this removes every tick
+    axes[0].xaxis.set_major_locator(NullLocator())
+    axes[0].yaxis.set_major_locator(NullLocator())
     for i, tp in enumerate(tps):
-        p = embedding(
-            adata,
-            "harmony",
-            color=tp_name,
-            groups=tp,
-            title=tp,
-            show=False,
-            ax=axes[i],
-            legend_loc="none",
-        )
-        p.set_axis_off()
+        mask = codes == i
+        for subset, color in [(~mask, "lightgray"), (mask, palette[tp])]:
+            axes[i].scatter(
+                coords[subset, 0],
+                coords[subset, 1],
+                s=size,
+                c=color,
+                rasterized=settings._vector_friendly,
+            )
+        axes[i].set_title(tp)
     if return_fig:
         return fig
     if show:
@@ -174,6 +206,8 @@ def sam(
     axes: Axes | None = None,
     colorbar: bool = True,
     s: float = 10.0,
+    rasterized: bool | None = None,
+    shade: bool | Literal["auto"] = False,
     **kwargs: Any,
 ) -> Axes:
     """Scatter plot using the SAM projection or another input projection.
@@ -183,15 +217,31 @@ def sam(
     projection
         A case-sensitive string indicating the projection to display (a key
         in adata.obsm) or a 2D numpy array with cell coordinates. If None,
-        projection defaults to UMAP.
+        projection defaults to UMAP. CuPy and PyTorch arrays residing on the
+        GPU are supported, only their first two columns are copied to the host.
     c
         Cell color values overlaid on the projection. Can be a string from adata.obs
         to overlay cluster assignments / annotations or a 1D numpy array.
+        Up to 50 categories are drawn as one labelled collection each,
+        so they can be listed with `axes.legend()`.
     axes
         Plot output to the specified, existing axes. If None, create new
         figure window.
+    rasterized
+        Draw the point cloud as a raster image, while axes, labels and the
+        colorbar stay vector graphics. If `None`, points are rasterized when
+        the scanpy setting `vector_friendly` is enabled or when more than
+        10,000 cells are plotted.
+    shade
+        Instead of drawing one marker per cell, aggregate cells into a 2D
+        histogram with one bin per pixel of `axes` and draw it as an image.
+        Bins show the cell count, the mean of numeric `c`,
+        or the color of the most frequent category of categorical `c`.
+        If `'auto'`, shade when more than 200,000 cells are plotted.
     kwargs
         all keyword arguments in matplotlib.pyplot.scatter are eligible.
+        When `shade` is used, only `vmin`, `vmax` and `norm` are used,
+        to scale numeric `c`.
 
     """
     if isinstance(projection, str):
@@ -202,61 +252,190 @@ def sam(
             raise ValueError(msg) from e
     else:
         dt = projection
+    if type(dt).__module__.startswith(("cupy", "torch")):
+        # only copy the two plotted columns off the GPU
+        dt = _to_host(dt[:, :2])
+    else:
+        # a view of the two plotted columns, also for data frames in obsm
+        dt = np.asarray(dt)[:, :2]
 
-    if axes is None:
-        plt.figure()
-        axes = plt.gca()
-
-    if c is None:
-        axes.scatter(
-            dt[:, 0], dt[:, 1], s=s, linewidth=linewidth, edgecolor=edgecolor, **kwargs
-        )
-        return axes
-
-    if isinstance(c, str):
-        with contextlib.suppress(KeyError):
-            c = np.array(list(adata.obs[c]))
-
-    if isinstance(c[0], str | np.str_) and isinstance(c, np.ndarray | list):
-        import samalg.utilities as ut
+    if rasterized is None:
+        rasterized = settings._vector_friendly or dt.shape[0] > 10_000
+    if shade == "auto":
+        shade = dt.shape[0] > 200_000
 
-        i = ut.convert_annotations(c)
-        ui, ai = np.unique(i, return_index=True)
-        cax = axes.scatter(
-            dt[:, 0],
-            dt[:, 1],
-            c=i,
+    if axes is None:
+        import matplotlib.pyplot as plt
+
+        axes = plt.figure().add_subplot()
+
+    c, codes, palette, categories = _resolve_sam_colors(adata, c, cmap)
+    # numeric values, mapped to colors by `cmap`
+    colormapped = isinstance(c, np.ndarray) and c.ndim == 1
+    if colormapped:
+        # convert once to the contiguous float array matplotlib maps from,
+        # and scale it with a precomputed norm instead of autoscaling
+        c = np.ascontiguousarray(c, dtype=float)
+        if "norm" not in kwargs:
+            kwargs["norm"] = Normalize(
+                kwargs.pop("vmin", np.nanmin(c)), kwargs.pop("vmax", np.nanmax(c))
+            )
+
+    if shade:
+        cax = _shade(
+            axes,
+            dt,
+            values=c if colormapped else None,
+            codes=codes,
+            palette=palette,
             cmap=cmap,
-            s=s,
-            linewidth=linewidth,
-            edgecolor=edgecolor,
-            **kwargs,
+            norm=kwargs.get("norm"),
         )
-
-        if colorbar:
-            cbar = plt.colorbar(cax, ax=axes, ticks=ui)
-            cbar.ax.set_yticklabels(c[ai])
+    elif codes is not None and len(categories) <= 50:
+        # For few categories, single-colored collections draw faster than
+        # per-point colors. Missing values (code -1) are drawn first.
+        for code in range(-1, len(categories)):
+            if not (mask := codes == code).any():
+                continue
+            axes.scatter(
+                dt[mask, 0],
+                dt[mask, 1],
+                color=palette[code],
+                label=categories[code] if code >= 0 else "NA",
+                s=s,
+                linewidth=linewidth,
+                edgecolor=edgecolor,
+                rasterized=rasterized,
+                **kwargs,
+            )
     else:
-        if not isinstance(c, np.ndarray | list):
-            colorbar = False
-        i = c
-
         cax = axes.scatter(
             dt[:, 0],
             dt[:, 1],
-            c=i,
-            cmap=cmap,
+            c=c if codes is None else palette[codes],
+            cmap=cmap if colormapped else None,
             s=s,
             linewidth=linewidth,
             edgecolor=edgecolor,
+            rasterized=rasterized,
             **kwargs,
         )
 
-        if colorbar:
-            plt.colorbar(cax, ax=axes)
+    if colorbar and codes is not None:
+        n_cats = len(categories)
+        cax = ScalarMappable(
+            norm=BoundaryNorm(np.arange(n_cats + 1) - 0.5, n_cats),
+            cmap=ListedColormap(palette[:-1]),
+        )
+        cbar = axes.figure.colorbar(cax, ax=axes, ticks=np.arange(n_cats))
+        cbar.ax.set_yticklabels(categories)
+    elif colorbar and colormapped:
+        axes.figure.colorbar(cax, ax=axes)
     return axes
 
 
+def _resolve_sam_colors(
+    adata: AnnData, c: Any, cmap: str
+) -> tuple[Any, np.ndarray | None, np.ndarray | None, np.ndarray | None]:
+    """Resolve `c` of :func:`sam` to `(c, codes, palette, categories)`.
+
+    For categorical or string annotations, `c` is `None` and cells are colored
+    by their category `codes` into the RGBA `palette`. Otherwise, only `c` is set.
+    """
+    codes = categories = None
+    if isinstance(c, str) and c in adata.obs.columns:
+        annotation = adata.obs[c]
+        if isinstance(annotation.dtype, pd.CategoricalDtype):
+            codes = annotation.cat.codes.to_numpy()
+            categories = annotation.cat.categories.to_numpy()
+        else:
+            c = annotation.to_numpy()
+    elif c is not None and not isinstance(c, str | tuple):
+        # array-likes such as pandas objects; tuples are single RGB(A) colors
+        c = np.asarray(c)
+
+    if codes is None:
+        if (
+            not isinstance(c, np.ndarray)
+            or c.ndim != 1
+            # unlike checking `c[0]`, this also handles a missing first value
+            or pd.api.types.infer_dtype(c, skipna=True) != "string"
+        ):
+            return c, None, None, None
+        codes, categories = pd.factorize(np.asarray(c), sort=True)
+
+    n_cats = len(categories)
+    # Look up one RGBA row per cell instead of having matplotlib remap
+    # category codes through the colormap on every draw.
+    # The extra last row is picked up by missing values (code -1).
+    palette = np.vstack(
+        [
+            colormaps.get_cmap(cmap).resampled(n_cats)(np.arange(n_cats)),
+            to_rgba("lightgray"),
+        ]
+    ).astype(np.float32)
+    return None, codes, palette, categories
+
+
+def _to_host(x) -> np.ndarray:
+    """Copy a CuPy array or PyTorch tensor to a host :class:`numpy.ndarray`."""
+    if type(x).__module__.startswith("cupy"):
+        return x.get()
+    return x.detach().cpu().numpy()
+
+
+def _shade(
+    axes: Axes,
+    dt: np.ndarray,
+    *,
+    values: np.ndarray | list | None = None,
+    codes: np.ndarray | None = None,
+    palette: np.ndarray | None = None,
+    cmap: str | None = None,
+    norm: Normalize | None = None,
+) -> AxesImage:
+    """Aggregate cells into a pixel-sized 2D histogram and draw it as image."""
+    x, y = dt[:, 0], dt[:, 1]
+    _, _, width, height = axes.bbox.bounds
+    extent = [np.nanmin(x), np.nanmax(x), np.nanmin(y), np.nanmax(y)]
+    hist = partial(
+        np.histogram2d,
+        x,
+        y,
+        bins=(max(int(width), 1), max(int(height), 1)),
+        range=[extent[:2], extent[2:]],
+    )
+    counts = hist()[0]
+
+    if codes is not None:
+        # color each bin by its most frequent category,
+        # keeping only a running maximum instead of one histogram per category
+        codes = np.where(codes < 0, len(palette) - 1, codes)
+        top_count = np.zeros_like(counts)
+        top_code = np.zeros(counts.shape, dtype=np.intp)
+        for code in range(len(palette)):
+            cat_counts = hist(weights=codes == code)[0]
+            top_code[cat_counts > top_count] = code
+            np.maximum(top_count, cat_counts, out=top_count)
+        img = palette[top_code]
+        img[counts == 0, 3] = 0
+    elif values is not None:
+        sums = hist(weights=values)[0]
+        img = np.divide(sums, counts, out=np.full_like(sums, np.nan), where=counts > 0)
+    else:
+        img = np.ma.masked_equal(counts, 0)
+
+    return axes.imshow(
+        img.swapaxes(0, 1),
+        origin="lower",
+        extent=extent,
+        cmap=cmap,
+        norm=norm if values is not None else None,
+        aspect="auto",
+        interpolation="nearest",
+    )
+
+
 @old_positionals(
     "no_bins",
     "smoothing_factor",
@@ -319,8 +498,19 @@ def wishbone_marker_trajectory(
     `branch2_wishbone` : :class:`pandas.DataFrame` (`adata.uns`)
         Computed values for the second branch.
 
+    Raises
+    ------
+    ValueError
+        If `markers` is empty.
+
     """
-    wb = _anndata_to_wishbone(adata)
+    markers = list(markers)
+    if not markers:
+        msg = "`markers` needs to contain at least one marker."
+        raise ValueError(msg)
+
+    # only the plotted markers are read from the expression table
+    wb = _anndata_to_wishbone(adata[:, markers])
 
     if figsize is None:
         width = 2 * len(markers)
@@ -328,11 +518,13 @@ def wishbone_marker_trajectory(
     else:
         width, height = figsize
 
-    if ax:
+    if ax is not None:
         fig = ax.figure
     else:
+        import matplotlib.pyplot as plt
+
         fig = plt.figure(figsize=(width, height))
-        ax = plt.gca()
+        ax = fig.add_subplot()
 
     ret_values, fig, ax = wb.plot_marker_trajectory(
         markers=markers,
@@ -2,16 +2,19 @@ from __future__ import annotations
 
 from itertools import product
 
+import numpy as np
+import pandas as pd
+import pytest
 from anndata import AnnData
+from matplotlib.ticker import NullLocator
 
 import scanpy as sc
 import scanpy.external as sce
 from testing.scanpy._helpers.data import pbmc3k
 from testing.scanpy._pytest.marks import needs
 
-pytestmark = [needs.harmony]
-
 
+@needs.harmony
 def test_load_timepoints_from_anndata_list():
     adata_ref = pbmc3k()
     start = [596, 615, 1682, 1663, 1409, 1432]
@@ -31,3 +34,44 @@ def test_load_timepoints_from_anndata_list():
     assert all(
         [adata.obsp["harmony_aff"].shape[0], adata.obsp["harmony_aff_aug"].shape[0]]
     ), "harmony_timeseries augmented affinity matrix Error!"
+
+
+@pytest.fixture
+def adata_harmony() -> AnnData:
+    rng = np.random.default_rng(0)
+    adata = AnnData(obs=pd.DataFrame(index=[f"cell{i}" for i in range(60)]))
+    adata.obsm["X_harmony"] = rng.random((60, 2))
+    adata.obs["time_points"] = pd.Categorical(
+        rng.choice(["d0", "d3", "d7"], 60), categories=["d0", "d3", "d7"]
+    )
+    adata.uns["harmony_timepoint_var"] = "time_points"
+    return adata
+
+
+@pytest.mark.parametrize("dtype", ["category", "object"])
+def test_plot_harmony_timeseries(adata_harmony: AnnData, dtype: str):
+    adata_harmony.obs["time_points"] = adata_harmony.obs["time_points"].astype(dtype)
+    axes = sce.pl.harmony_timeseries(adata_harmony, show=False)
+
+    assert [ax.get_title() for ax in axes] == ["d0", "d3", "d7"]
+    for ax, tp in zip(axes, ["d0", "d3", "d7"], strict=True):
+        n_tp = (adata_harmony.obs["time_points"] == tp).sum()
+        rest, current = ax.collections
+        assert len(current.get_offsets()) == n_tp
+        assert len(rest.get_offsets()) == adata_harmony.n_obs - n_tp
+        assert isinstance(ax.xaxis.get_major_locator(), NullLocator)
+        assert isinstance(ax.yaxis.get_major_locator(), NullLocator)
+        assert len(ax.get_xticks()) == len(ax.get_yticks()) == 0
+
+
+def test_plot_harmony_timeseries_single_timepoint(adata_harmony: AnnData):
+    adata_harmony.obs["time_points"] = pd.Categorical(["d0"] * adata_harmony.n_obs)
+    fig = sce.pl.harmony_timeseries(adata_harmony, return_fig=True)
+    [ax] = fig.axes
+    assert ax.get_title() == "d0"
+
+
+def test_plot_harmony_timeseries_not_categorical(adata_harmony: AnnData):
+    adata_harmony.obs["time_points"] = adata_harmony.obs["time_points"].cat.codes
+    with pytest.raises(ValueError, match=r"needs to be categorical"):
+        sce.pl.harmony_timeseries(adata_harmony, show=False)
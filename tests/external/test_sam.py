@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import anndata as ad
+import matplotlib.pyplot as plt
 import numpy as np
+import pandas as pd
+import pytest
+from anndata import AnnData
 
 import scanpy as sc
 import scanpy.external as sce
 from testing.scanpy._helpers.data import pbmc3k
 from testing.scanpy._pytest.marks import needs
 
-pytestmark = [needs.samalg]
-
 
+@needs.samalg
 def test_sam():
     adata_ref = pbmc3k()
     ix = np.random.choice(adata_ref.shape[0], size=200, replace=False)
@@ -20,3 +24,201 @@ def test_sam():
     uns_keys = list(adata.uns.keys())
     obsm_keys = list(adata.obsm.keys())
     assert all(["sam" in uns_keys, "X_umap" in obsm_keys, "neighbors" in uns_keys])
+
+
+@pytest.fixture
+def adata_sam() -> AnnData:
+    rng = np.random.default_rng(0)
+    adata = AnnData(obs=pd.DataFrame(index=[f"cell{i}" for i in range(300)]))
+    adata.obsm["X_umap"] = rng.random((300, 2))
+    adata.obs["value"] = rng.random(300)
+    adata.obs["cluster"] = pd.Categorical(
+        rng.choice(["a", "b", "c"], 300), categories=["c", "a", "b"]
+    )
+    adata.obs["label"] = adata.obs["cluster"].astype(str)
+    return adata
+
+
+@pytest.mark.parametrize(
+    "as_array_like", [np.asarray, list, pd.Series], ids=["array", "list", "series"]
+)
+def test_sam_plot_numeric_cmap(adata_sam: AnnData, as_array_like):
+    c = as_array_like(adata_sam.obs["value"].to_numpy())
+    ax = sce.pl.sam(adata_sam, c=c, cmap="Reds", vmin=0.2)
+    [cax] = ax.collections
+    assert cax.get_cmap().name == "Reds"
+    assert cax.norm.vmin == 0.2
+    # the colorbar is the second axes
+    assert len(ax.figure.axes) == 2
+
+
+@pytest.mark.parametrize(
+    ("c", "expected"),
+    [
+        pytest.param("cluster", ["c", "a", "b"], id="categorical"),
+        pytest.param("label", ["a", "b", "c"], id="strings"),
+    ],
+)
+def test_sam_plot_categories(adata_sam: AnnData, c: str, expected: list[str]):
+    adata_sam.obs.loc[adata_sam.obs_names[:5], c] = np.nan
+    ax = sce.pl.sam(adata_sam, c=c)
+
+    # few categories: one single-colored collection each, missing values first
+    assert [cax.get_label() for cax in ax.collections] == ["NA", *expected]
+    assert all(len(cax.get_facecolors()) == 1 for cax in ax.collections)
+    na = ax.collections[0]
+    assert len(na.get_offsets()) == 5
+    np.testing.assert_allclose(
+        na.get_facecolors()[0], [0.827, 0.827, 0.827, 1], atol=1e-3
+    )
+
+    _, cbar_ax = ax.figure.axes
+    assert [t.get_text() for t in cbar_ax.get_yticklabels()] == expected
+
+
+def test_sam_plot_many_categories(adata_sam: AnnData):
+    adata_sam.obs["many"] = pd.Categorical(
+        [f"cat{i % 60:02}" for i in range(adata_sam.n_obs)]
+    )
+    ax = sce.pl.sam(adata_sam, c="many")
+
+    # many categories: one collection with per-cell colors
+    [cax] = ax.collections
+    assert cax.get_facecolors().shape == (adata_sam.n_obs, 4)
+    _, cbar_ax = ax.figure.axes
+    assert [t.get_text() for t in cbar_ax.get_yticklabels()] == [
+        f"cat{i:02}" for i in range(60)
+    ]
+
+
+@pytest.mark.parametrize("c", [None, "red"])
+def test_sam_plot_no_colormap(adata_sam: AnnData, c: str | None):
+    ax = sce.pl.sam(adata_sam, c=c)
+    assert len(ax.collections) == 1
+    assert len(ax.figure.axes) == 1
+
+
+@pytest.fixture
+def adata_shade(adata_sam: AnnData) -> AnnData:
+    """Add two cells in the lower left and upper right corner of the plot."""
+    corners = AnnData(obs=pd.DataFrame(index=["lower_left", "upper_right"]))
+    corners.obsm["X_umap"] = np.array([[-1.0, -1.0], [2.0, 2.0]])
+    corners.obs["value"] = [0.5, 0.75]
+    corners.obs["cluster"] = pd.Categorical([np.nan, "a"])
+    return ad.concat([adata_sam, corners])
+
+
+@pytest.mark.parametrize("c", [None, "value", "cluster"])
+def test_sam_plot_shade(adata_shade: AnnData, c: str | None):
+    _, ax = plt.subplots()
+    _, _, width, height = ax.bbox.bounds
+    ax = sce.pl.sam(adata_shade, c=c, axes=ax, shade=True, colorbar=False)
+
+    [img] = ax.images
+    assert not ax.collections
+    arr = img.get_array()
+    assert arr.shape[:2] == (int(height), int(width))
+    assert img.get_extent() == [-1.0, 2.0, -1.0, 2.0]
+    lower_left, upper_right = arr[0, 0], arr[-1, -1]
+    if c is None:
+        # cell counts, with empty bins masked
+        assert lower_left == upper_right == 1
+        assert np.ma.getmaskarray(arr).mean() > 0.5
+    elif c == "value":
+        assert lower_left == 0.5
+        assert upper_right == 0.75
+        # mean values, with empty bins masked
+        assert np.ma.getmaskarray(arr).mean() > 0.5
+    else:
+        # colors of the most frequent category, empty bins are transparent
+        np.testing.assert_allclose(lower_left, [0.827, 0.827, 0.827, 1], atol=1e-3)
+        assert upper_right[3] == 1
+        assert (arr[..., 3] == 0).mean() > 0.5
+
+
+def test_sam_plot_shade_norm(adata_shade: AnnData):
+    ax = sce.pl.sam(adata_shade, c="value", shade=True, vmin=0.2, vmax=0.6)
+    [img] = ax.images
+    assert (img.norm.vmin, img.norm.vmax) == (0.2, 0.6)
+
+
+def test_sam_plot_shade_auto(adata_sam: AnnData):
+    ax = sce.pl.sam(adata_sam, shade="auto")
+    assert not ax.images
+    assert len(ax.collections) == 1
+
+
+@pytest.mark.parametrize(
+    ("n_obs", "vector_friendly", "expected"),
+    [
+        pytest.param(300, False, False, id="small"),
+        pytest.param(300, True, True, id="vector_friendly"),
+        pytest.param(10_001, False, True, id="large"),
+    ],
+)
+def test_sam_plot_rasterized_default(
+    *,
+    monkeypatch: pytest.MonkeyPatch,
+    n_obs: int,
+    vector_friendly: bool,
+    expected: bool,
+):
+    monkeypatch.setattr(sc.settings, "_vector_friendly", vector_friendly)
+    projection = np.random.default_rng(0).random((n_obs, 2))
+    ax = sce.pl.sam(AnnData(np.empty((n_obs, 0))), projection)
+    [cax] = ax.collections
+    assert cax.get_rasterized() is expected
+
+
+@pytest.mark.parametrize("rasterized", [True, False])
+@pytest.mark.parametrize("c", [None, "value", "cluster"])
+def test_sam_plot_rasterized(*, adata_sam: AnnData, c: str | None, rasterized: bool):
+    ax = sce.pl.sam(adata_sam, c=c, rasterized=rasterized)
+    assert ax.collections
+    assert all(cax.get_rasterized() is rasterized for cax in ax.collections)
+
+
+class _FakeDeviceArray:
+    """Mimics a CuPy array or PyTorch tensor, recording slicing and host copies."""
+
+    def __init__(self, data: np.ndarray, log: list[tuple[str, object]]) -> None:
+        self.data = data
+        self.log = log
+
+    def __getitem__(self, key) -> _FakeDeviceArray:
+        self.log.append(("getitem", key))
+        return type(self)(self.data[key], self.log)
+
+    # cupy
+    def get(self) -> np.ndarray:
+        self.log.append(("to_host", self.data.shape))
+        return self.data.copy()
+
+    # torch
+    def detach(self) -> _FakeDeviceArray:
+        return self
+
+    def cpu(self) -> _FakeDeviceArray:
+        self.log.append(("to_host", self.data.shape))
+        return self
+
+    def numpy(self) -> np.ndarray:
+        return self.data.copy()
+
+
+@pytest.mark.parametrize("module", ["cupy", "torch"])
+def test_sam_plot_device_array(adata_sam: AnnData, module: str):
+    fake_cls = type(
+        "FakeDeviceArray", (_FakeDeviceArray,), dict(__module__=f"{module}._fake")
+    )
+    projection = np.random.default_rng(0).random((adata_sam.n_obs, 10))
+    log = []
+    ax = sce.pl.sam(adata_sam, fake_cls(projection, log), c="value")
+
+    # only the two plotted columns are sliced on the device and then copied
+    assert log == [
+        ("getitem", (slice(None), slice(None, 2))),
+        ("to_host", (adata_sam.n_obs, 2)),
+    ]
+    [cax] = ax.collections
+    np.testing.assert_array_equal(cax.get_offsets(), projection[:, :2])
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+from anndata import AnnData
+
 import scanpy as sc
 import scanpy.external as sce
+from scanpy.external import pl as sce_pl
 from testing.scanpy._helpers.data import pbmc3k
 from testing.scanpy._pytest.marks import needs
 
-pytestmark = [needs.wishbone]
-
 
+@needs.wishbone
 def test_run_wishbone():
     adata = pbmc3k()
     sc.pp.normalize_per_cell(adata)
@@ -25,3 +31,66 @@ def test_run_wishbone():
     assert all([k in adata.obs for k in ["trajectory_wishbone", "branch_wishbone"]]), (
         "Run Wishbone Error!"
     )
+
+
+class _FakeWishbone:
+    """Stands in for :class:`wishbone.wb.Wishbone` in `wishbone_marker_trajectory`."""
+
+    def __init__(self, data: pd.DataFrame) -> None:
+        self.data = data
+
+    def plot_marker_trajectory(self, *, markers, fig, ax, **kwargs):
+        ret_values = {k: self.data[markers] for k in ["Trunk", "Branch1", "Branch2"]}
+        return ret_values, fig, ax
+
+
+@pytest.fixture
+def converted(monkeypatch: pytest.MonkeyPatch) -> list[pd.DataFrame]:
+    """Record what `_anndata_to_wishbone` converts, without needing wishbone."""
+    converted = []
+
+    def fake_anndata_to_wishbone(adata: AnnData) -> _FakeWishbone:
+        converted.append(adata.to_df())
+        return _FakeWishbone(converted[-1])
+
+    monkeypatch.setattr(sce_pl, "_anndata_to_wishbone", fake_anndata_to_wishbone)
+    return converted
+
+
+@pytest.fixture
+def adata() -> AnnData:
+    rng = np.random.default_rng(0)
+    adata = AnnData(
+        rng.random((20, 4), dtype=np.float32),
+        var=pd.DataFrame(index=list("abcd")),
+    )
+    adata.obsm["X_diffmap"] = rng.random((20, 3))
+    adata.obs["trajectory_wishbone"] = np.linspace(0, 1, 20)
+    adata.obs["branch_wishbone"] = pd.Categorical([1, 2, 3, 2] * 5)
+    return adata
+
+
+def test_wishbone_marker_trajectory(adata: AnnData, converted: list[pd.DataFrame]):
+    _, ax = plt.subplots()
+    n_figures = len(plt.get_fignums())
+
+    ret = sce.pl.wishbone_marker_trajectory(adata, ["c", "a"], ax=ax, show=False)
+
+    assert ret is ax
+    assert len(plt.get_fignums()) == n_figures
+    # only the plotted markers are converted
+    [df] = converted
+    assert list(df.columns) == ["c", "a"]
+    np.testing.assert_array_equal(df.to_numpy(), adata[:, ["c", "a"]].X)
+    for key in ["trunk_wishbone", "branch1_wishbone", "branch2_wishbone"]:
+        assert list(adata.uns[key].columns) == ["c", "a"]
+
+
+def test_wishbone_marker_trajectory_no_markers(
+    adata: AnnData, converted: list[pd.DataFrame]
+):
+    n_figures = len(plt.get_fignums())
+    with pytest.raises(ValueError, match=r"at least one marker"):
+        sce.pl.wishbone_marker_trajectory(adata, [], show=False)
+    assert not converted
+    assert len(plt.get_fignums()) == n_figures